@@ -1,3 +1,3 @@
-from .ingestor import ingest_document
+from .ingestor import ingest_document, ingest_documents
 
-__all__ = ["ingest_document"]
+__all__ = ["ingest_document", "ingest_documents"]
@@ -0,0 +1,26 @@
+"""
+Helpers shared by the Markdown and LaTeX parsers.
+"""
+
+from typing import NamedTuple
+
+
+class SectionRec(NamedTuple):
+    """One document section, as stored in a parse result's "sections" list."""
+
+    heading: str
+    level: int
+    text: str
+    category: str
+
+
+def normalise_newlines(data: bytes) -> bytes:
+    """Translate CRLF and lone CR to LF, as Path.read_text() does."""
+    if b"\r" in data:
+        data = data.replace(b"\r\n", b"\n").replace(b"\r", b"\n")
+    return data
+
+
+def decode(raw: bytes) -> str:
+    """Decode a retained fragment like Path.read_text(errors="replace") would."""
+    return raw.decode("utf-8", errors="replace")
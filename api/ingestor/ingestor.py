@@ -7,8 +7,16 @@ bypassing MinerU entirely.  The pipeline then starts at the "summary" stage.
 
 import json
 import logging
+import os
+from concurrent.futures import ProcessPoolExecutor
+from functools import cache
 from pathlib import Path
-from typing import Optional
+from typing import Iterator, List, Optional
+
+try:
+    import orjson  # type: ignore[import]
+except ImportError:  # optional: faster checkpoint serialisation
+    orjson = None
 
 logger = logging.getLogger(__name__)
 
@@ -18,6 +26,32 @@ logger = logging.getLogger(__name__)
 # ---------------------------------------------------------------------------
 
 
+# Parsers are imported lazily (keeps server start-up cheap) but only once:
+# later calls are a cache hit instead of another trip through the import
+# machinery.
+
+
+@cache
+def _md_parser():
+    from .md_parser import parse_markdown
+
+    return parse_markdown
+
+
+@cache
+def _tex_parser():
+    from .tex_parser import parse_latex
+
+    return parse_latex
+
+
+@cache
+def _zip_extractor():
+    from .zip_handler import extract_main_only
+
+    return extract_main_only
+
+
 def _make_result(query: str, answer: str) -> dict:
     return {
         "query": query,
@@ -27,96 +61,138 @@ def _make_result(query: str, answer: str) -> dict:
     }
 
 
-def _collect_category_text(sections: list, category: str) -> str:
-    """Concatenate text from all sections belonging to *category*."""
-    parts = [
-        s["text"] for s in sections if s.get("category") == category and s.get("text")
-    ]
-    return "\n\n".join(parts).strip()
+_TEXT_CATEGORIES = ("motivation", "solution", "results", "contributions", "paper_info")
 
 
-def _summarise_figures(figures: list) -> str:
-    if not figures:
-        return "No figures detected."
-    lines = []
+def _collect_category_texts(sections: list) -> dict:
+    """
+    Concatenate section text per category, in a single pass over *sections*.
+
+    Returns a dict with one (possibly empty) string per _TEXT_CATEGORIES entry.
+    """
+    buckets: dict = {c: [] for c in _TEXT_CATEGORIES}
+    for s in sections:
+        text = s.text
+        bucket = buckets.get(s.category)
+        if text and bucket is not None:
+            bucket.append(text)
+    return {c: "\n\n".join(parts).strip() for c, parts in buckets.items()}
+
+
+def _iter_figure_lines(figures: list) -> Iterator[str]:
     for i, fig in enumerate(figures, 1):
         cap = fig.get("caption", "").strip()
         path = fig.get("path", "").strip()
         if cap and path:
-            lines.append(f"Figure {i}: {cap} (file: {path})")
+            yield f"Figure {i}: {cap} (file: {path})"
         elif cap:
-            lines.append(f"Figure {i}: {cap}")
+            yield f"Figure {i}: {cap}"
         elif path:
-            lines.append(f"Figure {i}: {path}")
+            yield f"Figure {i}: {path}"
         else:
-            lines.append(f"Figure {i}: (no description)")
-    return "\n".join(lines)
+            yield f"Figure {i}: (no description)"
+
+
+def _iter_table_lines(tables: list) -> Iterator[str]:
+    for i, tbl in enumerate(tables, 1):
+        preview = tbl.strip()[:200].replace("\n", " ")
+        yield f"Table {i}: {preview}"
+
+
+def _iter_equation_lines(equations: list) -> Iterator[str]:
+    for i, eq in enumerate(equations[:30], 1):  # cap at 30 to avoid bloat
+        yield f"Eq. {i}: {eq.strip()[:120]}"
+    if len(equations) > 30:
+        yield f"... and {len(equations) - 30} more equations."
+
+
+def _summarise_figures(figures: list) -> str:
+    if not figures:
+        return "No figures detected."
+    return "\n".join(_iter_figure_lines(figures))
 
 
 def _summarise_tables(tables: list) -> str:
     if not tables:
         return "No tables detected."
-    lines = []
-    for i, tbl in enumerate(tables, 1):
-        preview = tbl.strip()[:200].replace("\n", " ")
-        lines.append(f"Table {i}: {preview}")
-    return "\n".join(lines)
+    return "\n".join(_iter_table_lines(tables))
 
 
 def _summarise_equations(equations: list) -> str:
     if not equations:
         return "No equations detected."
-    lines = []
-    for i, eq in enumerate(equations[:30], 1):  # cap at 30 to avoid bloat
-        lines.append(f"Eq. {i}: {eq.strip()[:120]}")
-    if len(equations) > 30:
-        lines.append(f"... and {len(equations) - 30} more equations.")
-    return "\n".join(lines)
+    return "\n".join(_iter_equation_lines(equations))
 
 
-def _build_export_markdown(parsed: dict, file_path: str) -> str:
-    """Build a clean Markdown export from the parsed document."""
-    lines = []
+def _build_export_markdown(parsed: dict, file_path: str) -> Iterator[str]:
+    """
+    Yield the lines of a clean Markdown export of the parsed document.
 
+    Lines carry no trailing newline; the caller writes one between each.
+    """
     title = parsed.get("title", "") or Path(file_path).stem
-    lines.append(f"# {title}\n")
+    yield f"# {title}\n"
 
     authors = parsed.get("authors", "")
     if authors:
-        lines.append(f"**Authors:** {authors}\n")
+        yield f"**Authors:** {authors}\n"
 
     abstract = parsed.get("abstract", "")
     if abstract:
-        lines.append("## Abstract\n")
-        lines.append(abstract + "\n")
+        yield "## Abstract\n"
+        yield abstract + "\n"
 
     for sec in parsed.get("sections", []):
-        heading = sec.get("heading", "Section")
-        level = sec.get("level", 2)
-        text = sec.get("text", "")
-        hashes = "#" * min(max(level, 2), 6)
-        lines.append(f"{hashes} {heading}\n")
-        if text:
-            lines.append(text + "\n")
+        hashes = "#" * min(max(sec.level, 2), 6)
+        yield f"{hashes} {sec.heading}\n"
+        if sec.text:
+            yield sec.text + "\n"
 
     figs = parsed.get("figures", [])
     if figs:
-        lines.append("## Figures\n")
-        lines.append(_summarise_figures(figs) + "\n")
+        yield "## Figures\n"
+        yield from _iter_figure_lines(figs)
+        yield ""
 
     tbls = parsed.get("tables", [])
     if tbls:
-        lines.append("## Tables\n")
+        yield "## Tables\n"
         for i, t in enumerate(tbls, 1):
-            lines.append(f"### Table {i}\n")
-            lines.append(t + "\n")
+            yield f"### Table {i}\n"
+            yield t + "\n"
 
     eqs = parsed.get("equations", [])
     if eqs:
-        lines.append("## Equations\n")
-        lines.append(_summarise_equations(eqs) + "\n")
-
-    return "\n".join(lines)
+        yield "## Equations\n"
+        yield from _iter_equation_lines(eqs)
+        yield ""
+
+
+def _init_logging(level: int) -> None:
+    """ProcessPoolExecutor initializer: give spawned workers a log handler."""
+    if not logging.getLogger().handlers:
+        logging.basicConfig(
+            level=level,
+            format="%(asctime)s [%(levelname)s] %(message)s",
+            datefmt="%H:%M:%S",
+        )
+    logging.getLogger().setLevel(level)
+
+
+def _write_json(path: Path, data: dict) -> None:
+    """Serialise *data* straight to *path* (orjson when available)."""
+    if orjson is not None:
+        with path.open("wb") as fp:
+            fp.write(
+                orjson.dumps(
+                    data,
+                    option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS,
+                    default=str,
+                )
+            )
+        return
+    with path.open("w", encoding="utf-8") as fp:
+        json.dump(data, fp, ensure_ascii=False, indent=2, default=str)
 
 
 # ---------------------------------------------------------------------------
@@ -155,23 +231,16 @@ def ingest_document(file_path: str, config: dict, base_dir: str) -> dict:
     parsed: dict
 
     if ext in (".md", ".markdown"):
-        from .md_parser import parse_markdown
-
-        parsed = parse_markdown(file_path)
+        parsed = _md_parser()(file_path)
 
     elif ext == ".tex":
-        from .tex_parser import parse_latex
-
-        parsed = parse_latex(file_path)
+        parsed = _tex_parser()(file_path)
 
     elif ext == ".zip":
-        from .zip_handler import extract_and_find_main
-
         extract_dir = str(Path(base_dir) / "fast" / "zip_extract")
-        main_tex = extract_and_find_main(file_path, extract_dir)
-        from .tex_parser import parse_latex
-
-        parsed = parse_latex(main_tex)
+        # Only the main .tex and the sources it includes are needed to parse
+        main_tex = _zip_extractor()(file_path, extract_dir)
+        parsed = _tex_parser()(main_tex)
 
     else:
         raise ValueError(
@@ -187,8 +256,12 @@ def ingest_document(file_path: str, config: dict, base_dir: str) -> dict:
     rag_output_dir.mkdir(parents=True, exist_ok=True)
 
     export_md_path = rag_output_dir / "export.md"
-    export_md_content = _build_export_markdown(parsed, file_path)
-    export_md_path.write_text(export_md_content, encoding="utf-8")
+    with export_md_path.open("w", encoding="utf-8", buffering=1 << 20) as md_fp:
+        sep = ""
+        for line in _build_export_markdown(parsed, file_path):
+            md_fp.write(sep)
+            md_fp.write(line)
+            sep = "\n"
     logger.info(f"  Export MD: {export_md_path}")
 
     # ------------------------------------------------------------------ #
@@ -200,11 +273,12 @@ def ingest_document(file_path: str, config: dict, base_dir: str) -> dict:
     sections = parsed.get("sections", [])
 
     # Collect text by category
-    motivation_text = _collect_category_text(sections, "motivation")
-    solution_text = _collect_category_text(sections, "solution")
-    results_text = _collect_category_text(sections, "results")
-    contributions_text = _collect_category_text(sections, "contributions")
-    paper_info_text = _collect_category_text(sections, "paper_info")
+    texts = _collect_category_texts(sections)
+    motivation_text = texts["motivation"]
+    solution_text = texts["solution"]
+    results_text = texts["results"]
+    contributions_text = texts["contributions"]
+    paper_info_text = texts["paper_info"]
 
     # Build paper_info answer
     paper_info_answer = f"Title: {title}\nAuthors: {authors}\nAbstract: {abstract}"
@@ -275,10 +349,62 @@ def ingest_document(file_path: str, config: dict, base_dir: str) -> dict:
 
     checkpoint_path = fast_dir / "checkpoint_rag.json"
     checkpoint_path.parent.mkdir(parents=True, exist_ok=True)
-    checkpoint_path.write_text(
-        json.dumps(rag_data, ensure_ascii=False, indent=2, default=str),
-        encoding="utf-8",
-    )
+    _write_json(checkpoint_path, rag_data)
     logger.info(f"  Checkpoint: {checkpoint_path}")
 
     return rag_data
+
+
+def ingest_documents(
+    file_paths: List[str],
+    config: dict,
+    base_dir: str,
+    max_workers: Optional[int] = None,
+) -> List[dict]:
+    """
+    Ingest several documents in parallel, one worker process per file.
+
+    Parsing is CPU-bound pure-Python regex work, so a process pool sidesteps
+    the GIL.  Each document gets its own sub-directory of *base_dir* named
+    after the file stem (plus a numeric suffix on collisions), so outputs
+    never clash.
+
+    Args:
+        file_paths:  Source documents (.md / .markdown / .tex / .zip).
+        config:      Pipeline config dict, shared by every document.
+        base_dir:    Parent directory for the per-document base dirs.
+        max_workers: Pool size (default: min(len(file_paths), cpu_count)).
+
+    Returns:
+        The rag_data dicts, in the same order as *file_paths*.
+    """
+    if not file_paths:
+        return []
+
+    sub_dirs: List[str] = []
+    used: set = set()
+    for i, path in enumerate(file_paths):
+        stem = name = Path(path).stem
+        # The suffixed name may itself be taken (a_2.md, a.md, x/a.md)
+        n = i
+        while name in used:
+            name = f"{stem}_{n}"
+            n += 1
+        used.add(name)
+        sub_dirs.append(str(Path(base_dir) / name))
+
+    if len(file_paths) == 1:
+        return [ingest_document(file_paths[0], config, sub_dirs[0])]
+
+    workers = max_workers or min(len(file_paths), os.cpu_count() or 1)
+    logger.info(f"ingest_documents: {len(file_paths)} files, {workers} workers")
+    with ProcessPoolExecutor(
+        max_workers=workers,
+        initializer=_init_logging,
+        initargs=(logging.getLogger().getEffectiveLevel(),),
+    ) as pool:
+        futures = [
+            pool.submit(ingest_document, path, config, sub_dir)
+            for path, sub_dir in zip(file_paths, sub_dirs)
+        ]
+        return [f.result() for f in futures]
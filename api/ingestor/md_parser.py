@@ -5,197 +5,230 @@ Parses .md / .markdown files into a structured dict compatible with
 checkpoint_rag.json without going through MinerU or PDF conversion.
 """
 
+import os
 import re
+import mmap
 import logging
-from pathlib import Path
+from bisect import bisect_right
+from contextlib import contextmanager
+from itertools import accumulate
+from typing import Iterator, Union
+
+from ._common import SectionRec, decode, normalise_newlines
 
 logger = logging.getLogger(__name__)
 
+
 # ---------------------------------------------------------------------------
-# Section category classifier
+# Precompiled patterns
 # ---------------------------------------------------------------------------
 
+# The document patterns are bytes patterns: parse_markdown scans the memory-
+# mapped file directly and only decodes the fragments it keeps.
+_FRONTMATTER_RE = re.compile(rb"^---\s*\n(.*?)\n---\s*\n", re.DOTALL)
+_FM_KV_RE = re.compile(rb"^([^\s:][^:\n]*):[ \t]*([^\n]*)$", re.MULTILINE)
+_TABLE_RUN_RE = re.compile(rb"(?:^[^\n]*\|[^\n]*(?:\n|$))+", re.MULTILINE)
+_TABLE_SEP_RE = re.compile(rb"\|[-:]+\|")
+_AUTHOR_NAME_RE = re.compile(r"[A-Z][a-z]+")
 
-def _classify_section(heading: str) -> str:
-    """Map a section heading to one of the checkpoint categories."""
-    h = heading.lower()
-    if "abstract" in h:
-        return "abstract"
-    if any(
-        k in h
-        for k in ("introduction", "background", "related work", "related", "prior")
-    ):
-        return "motivation"
-    if any(
-        k in h
-        for k in (
-            "method",
-            "approach",
-            "model",
-            "architecture",
-            "system",
-            "proposed",
-            "framework",
-        )
-    ):
-        return "solution"
-    if any(
-        k in h
-        for k in (
-            "result",
-            "experiment",
-            "evaluation",
-            "performance",
-            "benchmark",
-            "analysis",
-        )
-    ):
-        return "results"
-    if any(
-        k in h
-        for k in ("conclusion", "contribution", "summary", "discussion", "future")
-    ):
-        return "contributions"
-    return "paper_info"
-
+# Block and inline equations in a single pass; ``Match.lastindex`` is the body
+# group of whichever branch hit.
+_EQ_RE = re.compile(
+    rb"\$\$(.+?)\$\$" rb"|(?<!\$)\$(?!\$)([^$\n]{2,}?)(?<!\$)\$(?!\$)",
+    re.DOTALL,
+)
+# Figures and headings get scans of their own: sharing an alternation with the
+# DOTALL $$...$$ branch, a stray "$$" (e.g. a shell `echo $$`) and a later one
+# would swallow every figure or heading between them.
+_FIG_RE = re.compile(rb"!\[([^\]]*)\]\(([^)]*)\)")
+_HEADING_RE = re.compile(rb"^(#{1,6})\s+([^\n]+?)[ \t]*$", re.MULTILINE)
 
 # ---------------------------------------------------------------------------
-# Public API
+# Section category classifier
 # ---------------------------------------------------------------------------
 
+# Checked in priority order: the first category with any keyword occurring
+# (as a substring) in the lowercased heading wins.
+_CATEGORY_KEYWORDS = (
+    ("abstract", frozenset({"abstract"})),
+    (
+        "motivation",
+        frozenset({"introduction", "background", "related work", "related", "prior"}),
+    ),
+    (
+        "solution",
+        frozenset(
+            {
+                "method",
+                "approach",
+                "model",
+                "architecture",
+                "system",
+                "proposed",
+                "framework",
+            }
+        ),
+    ),
+    (
+        "results",
+        frozenset(
+            {
+                "result",
+                "experiment",
+                "evaluation",
+                "performance",
+                "benchmark",
+                "analysis",
+            }
+        ),
+    ),
+    (
+        "contributions",
+        frozenset({"conclusion", "contribution", "summary", "discussion", "future"}),
+    ),
+)
+_CATEGORIES = tuple(cat for cat, _ in _CATEGORY_KEYWORDS)
+_KEYWORD_RANK = {
+    kw: rank for rank, (_, kws) in enumerate(_CATEGORY_KEYWORDS) for kw in kws
+}
+
+# Zero-width lookahead so every keyword occurrence is reported, even where
+# keywords overlap; keywords are listed in priority order so the higher
+# ranked one wins when two start at the same offset.
+_KEYWORD_RE = re.compile(
+    "(?=("
+    + "|".join(
+        re.escape(kw)
+        for _, kws in _CATEGORY_KEYWORDS
+        for kw in sorted(kws, key=len, reverse=True)
+    )
+    + "))"
+)
 
-def parse_markdown(path: str) -> dict:
+
+def _classify_sections(headings: list) -> list:
     """
-    Parse a Markdown file into structured content.
+    Map each section heading to one of the checkpoint categories.
 
-    Returns a dict with keys:
-        title       – str, document title
-        abstract    – str, abstract text (may be empty)
-        authors     – str, author line (may be empty)
-        sections    – list of {heading, level, text, category}
-        figures     – list of {caption, path}
-        tables      – list of str (raw table text)
-        equations   – list of str (math expressions)
+    All headings are scanned in one regex pass over their newline-joined,
+    lowercased text; each keyword hit is routed back to its heading by
+    bisecting the heading end offsets.
     """
-    text = Path(path).read_text(encoding="utf-8", errors="replace")
+    lowered = [h.lower() for h in headings]
+    ends = list(accumulate(len(h) + 1 for h in lowered))
+    no_match = len(_CATEGORIES)
+    ranks = [no_match] * len(lowered)
+    for m in _KEYWORD_RE.finditer("\n".join(lowered)):
+        idx = bisect_right(ends, m.start())
+        rank = _KEYWORD_RANK[m.group(1)]
+        if rank < ranks[idx]:
+            ranks[idx] = rank
+    return [_CATEGORIES[r] if r != no_match else "paper_info" for r in ranks]
 
-    result: dict = {
-        "title": "",
-        "abstract": "",
-        "authors": "",
-        "sections": [],
-        "figures": [],
-        "tables": [],
-        "equations": [],
-    }
 
+# ---------------------------------------------------------------------------
+# File access
+# ---------------------------------------------------------------------------
+
+
+@contextmanager
+def _mapped(path: str) -> Iterator[Union[mmap.mmap, bytes]]:
+    """Yield a read-only memory map of *path* (b"" for an empty file)."""
+    with open(path, "rb") as f:
+        if os.fstat(f.fileno()).st_size == 0:  # empty files cannot be mapped
+            yield b""
+            return
+        with mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            yield mm
+
+
+def _parse_buffer(buf: Union[mmap.mmap, bytes], result: dict) -> None:
+    """Fill *result* from the raw UTF-8 bytes of a Markdown document."""
     # ------------------------------------------------------------------ #
     # 1. YAML / TOML frontmatter                                         #
     # ------------------------------------------------------------------ #
     frontmatter: dict = {}
-    fm_match = re.match(r"^---\s*\n(.*?)\n---\s*\n", text, re.DOTALL)
+    start = 0
+    fm_match = _FRONTMATTER_RE.match(buf)
     if fm_match:
-        for line in fm_match.group(1).splitlines():
-            if ":" in line:
-                k, _, v = line.partition(":")
-                frontmatter[k.strip().lower()] = v.strip()
-        text = text[fm_match.end() :]
+        frontmatter = {
+            decode(k).strip().lower(): decode(v).strip().strip("\"'")
+            for k, v in _FM_KV_RE.findall(fm_match.group(1))
+        }
+        start = fm_match.end()
 
     if "title" in frontmatter:
-        result["title"] = frontmatter["title"].strip("\"'")
+        result["title"] = frontmatter["title"]
     if "author" in frontmatter:
         result["authors"] = frontmatter["author"]
     if "authors" in frontmatter:
         result["authors"] = frontmatter["authors"]
 
     # ------------------------------------------------------------------ #
-    # 2. Block equations  $$...$$                                         #
+    # 2. Equations, figures and heading positions                        #
     # ------------------------------------------------------------------ #
-    _block_eq_re = re.compile(r"\$\$(.+?)\$\$", re.DOTALL)
-    for m in _block_eq_re.finditer(text):
-        eq = m.group(1).strip()
-        if eq:
+    # Alternation order matters: $$...$$ is tried before $...$, so block
+    # equations are never double-counted by the inline branch.
+    # Repeated expressions ($n$, $O(n)$, ...) and re-used images are kept once.
+    eq_seen: set = set()
+    for m in _EQ_RE.finditer(buf, start):
+        eq = decode(m.group(m.lastindex)).strip()
+        if eq and eq not in eq_seen:
+            eq_seen.add(eq)
             result["equations"].append(eq)
-    # Replace block equations so inline scanner doesn't double-count
-    text_no_block = _block_eq_re.sub("[EQUATION]", text)
 
-    # ------------------------------------------------------------------ #
-    # 3. Inline equations  $...$                                          #
-    # ------------------------------------------------------------------ #
-    _inline_eq_re = re.compile(r"(?<!\$)\$(?!\$)([^$\n]{2,}?)(?<!\$)\$(?!\$)")
-    for m in _inline_eq_re.finditer(text_no_block):
-        eq = m.group(1).strip()
-        if eq:
-            result["equations"].append(eq)
+    fig_seen: set = set()
+    for m in _FIG_RE.finditer(buf, start):
+        path = decode(m.group(2)).strip()
+        if not path or path not in fig_seen:
+            fig_seen.add(path)
+            caption = decode(m.group(1)).strip()
+            result["figures"].append({"caption": caption, "path": path})
 
-    # ------------------------------------------------------------------ #
-    # 4. Figures  ![alt](path)                                            #
-    # ------------------------------------------------------------------ #
-    for m in re.finditer(r"!\[([^\]]*)\]\(([^)]*)\)", text):
-        result["figures"].append(
-            {"caption": m.group(1).strip(), "path": m.group(2).strip()}
-        )
+    # Heading positions: (level, heading, line_start, line_end)
+    heading_spans = [
+        (len(m.group(1)), decode(m.group(2)).strip(), m.start(), m.end())
+        for m in _HEADING_RE.finditer(buf, start)
+    ]
 
     # ------------------------------------------------------------------ #
-    # 5. Tables (runs of lines containing |)                              #
+    # 3. Tables (runs of lines containing |)                              #
     # ------------------------------------------------------------------ #
-    table_buf: list = []
-    for line in text.splitlines():
-        stripped = line.strip()
-        if "|" in stripped:
-            table_buf.append(line)
-        else:
-            if table_buf:
-                # Only keep if it looks like a real table (has separator row or ≥2 rows)
-                raw = "\n".join(table_buf)
-                if len(table_buf) >= 2 or re.search(r"\|[-:]+\|", raw):
-                    result["tables"].append(raw)
-                table_buf = []
-    if table_buf:
-        result["tables"].append("\n".join(table_buf))
+    # One match per run of consecutive lines containing "|".  Only keep a run
+    # if it looks like a real table (has separator row or ≥2 rows).
+    for m in _TABLE_RUN_RE.finditer(buf, start):
+        raw = m.group(0).rstrip(b"\r\n")
+        if raw.count(b"\n") >= 1 or _TABLE_SEP_RE.search(raw):
+            result["tables"].append(decode(raw))
 
     # ------------------------------------------------------------------ #
-    # 6. Headings & sections                                              #
+    # 4. Sections (bodies sliced between the heading spans found above)  #
     # ------------------------------------------------------------------ #
-    # Split document at heading boundaries.
-    # re.split with 2 capturing groups returns:
-    #   [pre, hashes, heading_text, body, hashes, heading_text, body, ...]
-    _heading_re = re.compile(r"^(#{1,6})\s+(.+?)[ \t]*$", re.MULTILINE)
-    parts = _heading_re.split(text)
-
-    # parts[0] is preamble (before first heading)
-    # Extract title from first H1 if not found in frontmatter
-    for i in range(1, len(parts), 3):
-        level_str = parts[i]  # e.g. '##'
-        heading = parts[i + 1].strip()
-        body = parts[i + 2].strip() if (i + 2) < len(parts) else ""
-
-        level = len(level_str)
+    categories = _classify_sections([h for _, h, _, _ in heading_spans])
+    for idx, (level, heading, _start, line_end) in enumerate(heading_spans):
+        body_end = (
+            heading_spans[idx + 1][2] if idx + 1 < len(heading_spans) else len(buf)
+        )
+        body = decode(buf[line_end:body_end]).strip()
 
         # Title: first H1
         if level == 1 and not result["title"]:
             result["title"] = heading
 
-        category = _classify_section(heading)
+        category = categories[idx]
 
-        result["sections"].append(
-            {
-                "heading": heading,
-                "level": level,
-                "text": body,
-                "category": category,
-            }
-        )
+        result["sections"].append(SectionRec(heading, level, body, category))
 
         # Capture abstract
         if category == "abstract" and not result["abstract"]:
             result["abstract"] = body
 
     # ------------------------------------------------------------------ #
-    # 7. Try to extract authors from preamble / first paragraph          #
+    # 5. Try to extract authors from preamble / first paragraph          #
     # ------------------------------------------------------------------ #
     if not result["authors"]:
-        preamble = parts[0] if parts else ""
+        preamble_end = heading_spans[0][2] if heading_spans else len(buf)
+        preamble = decode(buf[start:preamble_end])
         # Look for lines that might be author lines (after the title line)
         lines = [ln.strip() for ln in preamble.splitlines() if ln.strip()]
         # Skip H1 title line if present
@@ -207,10 +240,47 @@ def parse_markdown(path: str) -> dict:
             if len(candidate) < 200 and (
                 "," in candidate
                 or " and " in candidate.lower()
-                or re.match(r"[A-Z][a-z]+", candidate)
+                or _AUTHOR_NAME_RE.match(candidate)
             ):
                 result["authors"] = candidate
 
+
+# ---------------------------------------------------------------------------
+# Public API
+# ---------------------------------------------------------------------------
+
+
+def parse_markdown(path: str) -> dict:
+    """
+    Parse a Markdown file into structured content.
+
+    Returns a dict with keys:
+        title       – str, document title
+        abstract    – str, abstract text (may be empty)
+        authors     – str, author line (may be empty)
+        sections    – list of SectionRec(heading, level, text, category)
+        figures     – list of {caption, path}
+        tables      – list of str (raw table text)
+        equations   – list of str (math expressions)
+    """
+    result: dict = {
+        "title": "",
+        "abstract": "",
+        "authors": "",
+        "sections": [],
+        "figures": [],
+        "tables": [],
+        "equations": [],
+    }
+
+    # All scanning runs over the memory-mapped bytes; only the fragments
+    # stored in *result* are ever decoded to str.  Files with CR line endings
+    # are normalised into a private copy first, so every pattern sees LF only.
+    with _mapped(path) as buf:
+        if buf.find(b"\r") != -1:
+            buf = normalise_newlines(buf[:])
+        _parse_buffer(buf, result)
+
     logger.debug(
         "parse_markdown: title=%r sections=%d figures=%d tables=%d equations=%d",
         result["title"],
@@ -5,12 +5,17 @@ Optional: requires pdflatex on PATH (or at the fallback Windows path).
 Returns None gracefully when unavailable.
 """
 
+import os
 import shutil
+import signal
 import subprocess
 import logging
 import tempfile
+from importlib.util import find_spec
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from pathlib import Path
-from typing import Optional
+from typing import List, Literal, Optional
 
 logger = logging.getLogger(__name__)
 
@@ -21,6 +26,10 @@ _PDFLATEX = (
     else (_PDFLATEX_FALLBACK if Path(_PDFLATEX_FALLBACK).exists() else None)
 )
 
+_RENDER_DPI = 150
+# PGF rasters are small; fast zlib beats a few percent smaller files.
+_PNG_SAVE_OPTS = {"optimize": False, "compress_level": 1}
+
 _STANDALONE_TEX = r"""\documentclass[border=2pt]{{standalone}}
 \usepackage{{pgf}}
 \begin{{document}}
@@ -28,14 +37,164 @@ _STANDALONE_TEX = r"""\documentclass[border=2pt]{{standalone}}
 \end{{document}}
 """
 
+# Multi-page driver for PgfBatchRenderer: every pgfpage environment becomes
+# its own (cropped) page of the output PDF.
+_BATCH_PREAMBLE = r"""\documentclass[border=2pt,multi]{standalone}
+\usepackage{pgf}
+\newenvironment{pgfpage}{}{}
+\standaloneenv{pgfpage}
+\begin{document}
+"""
+_BATCH_PAGE = r"""\begin{{pgfpage}}\input{{{pgf_path}}}\end{{pgfpage}}
+"""
+_BATCH_END = r"""\end{document}
+"""
+
+
+def _copy_file(src: Path, dst: Path) -> None:
+    """Copy *src* to *dst* in kernel space where supported (copy_file_range)."""
+    try:
+        with open(src, "rb") as fsrc, open(dst, "wb") as fdst:
+            remaining = os.fstat(fsrc.fileno()).st_size
+            while remaining > 0:
+                copied = os.copy_file_range(fsrc.fileno(), fdst.fileno(), remaining)
+                if copied == 0:
+                    break
+                remaining -= copied
+        if remaining == 0:
+            return
+    except (AttributeError, OSError):
+        pass
+    shutil.copy2(str(src), str(dst))
+
+
+def _resolve_prefer(prefer: Optional[str]) -> str:
+    """Default output format: "png", or "pdf" when P2S_PGF_RASTERIZE=0."""
+    if prefer is not None:
+        return prefer
+    return "pdf" if os.getenv("P2S_PGF_RASTERIZE", "1").strip() == "0" else "png"
 
-def render_pgf_to_png(pgf_path: str, output_dir: str) -> Optional[str]:
+
+def _have_rasterizer() -> bool:
+    """True if pypdfium2 or pdf2image is importable."""
+    return find_spec("pypdfium2") is not None or find_spec("pdf2image") is not None
+
+
+def _render_pdf_pages(pdf_path: Path, first_only: bool = False) -> list:
+    """
+    Rasterise the pages of *pdf_path* to PIL images.
+
+    Prefers pypdfium2 (in-process PDFium) and falls back to pdf2image
+    (Poppler's pdftoppm subprocess).  Returns [] if neither works.
     """
-    Compile a PGF file to PNG via pdflatex standalone + pdf2image / PIL.
+    try:
+        import pypdfium2 as pdfium  # type: ignore[import]
+    except ImportError:
+        pdfium = None
+
+    if pdfium is not None:
+        try:
+            pdf = pdfium.PdfDocument(str(pdf_path))
+            try:
+                count = 1 if first_only else len(pdf)
+                return [
+                    pdf[i].render(scale=_RENDER_DPI / 72).to_pil() for i in range(count)
+                ]
+            finally:
+                pdf.close()
+        except Exception as exc:
+            logger.debug(f"pypdfium2 could not render {pdf_path}: {exc}")
+
+    try:
+        from pdf2image import convert_from_path  # type: ignore[import]
+
+        pages = {"first_page": 1, "last_page": 1} if first_only else {}
+        return convert_from_path(str(pdf_path), dpi=_RENDER_DPI, **pages)
+    except Exception:
+        return []
+
+
+def _pdflatex_timeout() -> float:
+    """pdflatex wall-time limit in seconds (P2S_PDFLATEX_TIMEOUT, default 15)."""
+    try:
+        return float(os.getenv("P2S_PDFLATEX_TIMEOUT", "15"))
+    except ValueError:
+        return 15.0
+
+
+def _kill_process_tree(proc: subprocess.Popen) -> None:
+    """Kill *proc* and everything it spawned (it leads its own process group)."""
+    try:
+        if os.name == "posix":
+            os.killpg(proc.pid, signal.SIGKILL)
+        else:
+            subprocess.run(
+                ["taskkill", "/F", "/T", "/PID", str(proc.pid)], capture_output=True
+            )
+    except (ProcessLookupError, OSError):
+        pass
+    proc.kill()
+    proc.communicate()
+
+
+def _run_pdflatex(tex_file: Path, tmp: str, label: str, timeout: float) -> bool:
+    """Compile *tex_file* in *tmp* within *timeout* s; log, return False on failure."""
+    cmd = [
+        str(_PDFLATEX),
+        "-interaction=nonstopmode",
+        "-halt-on-error",
+        f"-output-directory={tmp}",
+        str(tex_file),
+    ]
+    # Run in a new process group so a hung run (and any shell-escape
+    # children) can be killed as a whole.  start_new_session is the
+    # thread-safe equivalent of preexec_fn=os.setsid.
+    if os.name == "posix":
+        group_kwargs = {"start_new_session": True}
+    else:
+        group_kwargs = {"creationflags": subprocess.CREATE_NEW_PROCESS_GROUP}
+    try:
+        proc = subprocess.Popen(
+            cmd,
+            cwd=tmp,
+            stdout=subprocess.PIPE,
+            stderr=subprocess.PIPE,
+            text=True,
+            **group_kwargs,
+        )
+    except FileNotFoundError as exc:
+        logger.warning(f"pdflatex failed for {label}: {exc}")
+        return False
+
+    try:
+        stdout, _ = proc.communicate(timeout=timeout)
+    except subprocess.TimeoutExpired:
+        _kill_process_tree(proc)
+        logger.warning(f"pdflatex timed out after {timeout:g}s for {label}")
+        return False
+
+    if proc.returncode != 0:
+        last_lines = "\n".join(stdout.splitlines()[-10:])
+        logger.warning(f"pdflatex non-zero exit for {label}:\n{last_lines}")
+        return False
+    return True
+
+
+def render_pgf_to_png(
+    pgf_path: str,
+    output_dir: str,
+    prefer: Optional[Literal["png", "pdf"]] = None,
+) -> Optional[str]:
+    """
+    Compile a PGF file to PNG via pdflatex standalone + pypdfium2 /
+    pdf2image / PIL.
 
     Args:
         pgf_path:   Absolute path to the .pgf file.
         output_dir: Directory where the PNG (or PDF fallback) is written.
+        prefer:     "pdf" skips rasterisation and returns the vector PDF
+                    (for consumers that embed PDFs directly).  Defaults to
+                    "png", or "pdf" when the env var P2S_PGF_RASTERIZE=0.
 
     Returns:
         Path to the generated PNG (or PDF if conversion unavailable),
@@ -58,28 +217,7 @@ def render_pgf_to_png(pgf_path: str, output_dir: str) -> Optional[str]:
             _STANDALONE_TEX.format(pgf_path=pgf_posix), encoding="utf-8"
         )
 
-        cmd = [
-            str(_PDFLATEX),
-            "-interaction=nonstopmode",
-            "-halt-on-error",
-            f"-output-directory={tmp}",
-            str(tex_file),
-        ]
-        try:
-            result = subprocess.run(
-                cmd,
-                cwd=tmp,
-                capture_output=True,
-                text=True,
-                timeout=60,
-            )
-        except (subprocess.TimeoutExpired, FileNotFoundError) as exc:
-            logger.warning(f"pdflatex failed for {pgf_path}: {exc}")
-            return None
-
-        if result.returncode != 0:
-            last_lines = "\n".join(result.stdout.splitlines()[-10:])
-            logger.warning(f"pdflatex non-zero exit for {pgf_path}:\n{last_lines}")
+        if not _run_pdflatex(tex_file, tmp, pgf_path, _pdflatex_timeout()):
             return None
 
         pdf_tmp = Path(tmp) / f"{stem}.pdf"
@@ -89,18 +227,17 @@ def render_pgf_to_png(pgf_path: str, output_dir: str) -> Optional[str]:
 
         # Copy PDF to output first (fallback return value)
         pdf_out = out_dir / f"{stem}.pdf"
-        import shutil as _shutil
-
-        _shutil.copy2(str(pdf_tmp), str(pdf_out))
+        _copy_file(pdf_tmp, pdf_out)
+        if _resolve_prefer(prefer) == "pdf":
+            logger.info(f"PGF compiled to PDF → {pdf_out.name}")
+            return str(pdf_out)
 
         # Attempt PDF → PNG conversion
         png_out = out_dir / f"{stem}.png"
         try:
-            from pdf2image import convert_from_path  # type: ignore[import]
-
-            images = convert_from_path(str(pdf_out), dpi=150, first_page=1, last_page=1)
+            images = _render_pdf_pages(pdf_out, first_only=True)
             if images:
-                images[0].save(str(png_out), "PNG")
+                images[0].save(str(png_out), "PNG", **_PNG_SAVE_OPTS)
                 logger.info(f"PGF rendered → {png_out.name}")
                 return str(png_out)
         except Exception:
@@ -120,3 +257,125 @@ def render_pgf_to_png(pgf_path: str, output_dir: str) -> Optional[str]:
         # Return PDF path as last resort
         logger.info(f"PGF compiled to PDF (no PNG converter) → {pdf_out.name}")
         return str(pdf_out)
+
+
+def render_pgfs_to_png(
+    pgf_paths: List[str],
+    output_dir: str,
+    max_workers: Optional[int] = None,
+    prefer: Optional[Literal["png", "pdf"]] = None,
+) -> List[Optional[str]]:
+    """
+    Render independent PGF files concurrently, one pdflatex process each.
+
+    pdflatex is single-threaded, so running one per core gives close to
+    linear wall-clock speed-up.  Each render already uses its own temporary
+    directory, so the workers share nothing.  Lower *max_workers* if the
+    figures are large enough for pdflatex memory use to matter.
+
+    Returns:
+        render_pgf_to_png() results, in the same order as *pgf_paths*.
+    """
+    if not pgf_paths:
+        return []
+    render = partial(render_pgf_to_png, output_dir=output_dir, prefer=prefer)
+    workers = max_workers or min(len(pgf_paths), os.cpu_count() or 1)
+    if workers <= 1:
+        return [render(p) for p in pgf_paths]
+    # Threads are enough: the heavy lifting happens in the pdflatex/pdftoppm
+    # child processes, and waiting on them releases the GIL.
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return list(pool.map(render, pgf_paths))
+
+
+class PgfBatchRenderer:
+    """
+    Render many PGF files with a single pdflatex run.
+
+    LaTeX start-up (format loading, package init) dominates the cost of a
+    small PGF figure, so queued files are compiled as pages of one
+    multi-page standalone document and rasterised in one pass.
+    Any batch-level failure (compile error, missing converter, page count
+    mismatch) falls back to render_pgf_to_png() per file.
+
+    Usage::
+
+        batch = PgfBatchRenderer(output_dir)
+        for p in pgf_paths:
+            batch.add(p)
+        pngs = batch.render()   # one entry per added path, in order
+    """
+
+    def __init__(self, output_dir: str, prefer: Optional[Literal["png", "pdf"]] = None):
+        self.output_dir = Path(output_dir)
+        self.prefer = prefer
+        self._queue: List[Path] = []
+
+    def add(self, pgf_path: str) -> None:
+        """Queue *pgf_path* for the next render()."""
+        self._queue.append(Path(pgf_path).resolve())
+
+    def render(self) -> List[Optional[str]]:
+        """
+        Compile every queued file and clear the queue.
+
+        Returns:
+            One PNG path (or render_pgf_to_png() fallback result) per queued
+            file, in queue order.
+        """
+        paths, self._queue = self._queue, []
+        if not paths:
+            return []
+        if _PDFLATEX is None:
+            logger.warning("pdflatex not found; skipping PGF rendering.")
+            return [None] * len(paths)
+        render = partial(
+            render_pgf_to_png, output_dir=str(self.output_dir), prefer=self.prefer
+        )
+        # PDF output needs one file per figure, which only per-file runs give
+        if len(paths) == 1 or _resolve_prefer(self.prefer) == "pdf":
+            return [render(str(p)) for p in paths]
+
+        rendered = self._render_batch(paths)
+        if rendered is None:
+            logger.info(f"PGF batch fallback: rendering {len(paths)} files one by one")
+            return [render(str(p)) for p in paths]
+        return rendered
+
+    def _render_batch(self, paths: List[Path]) -> Optional[List[str]]:
+        if not _have_rasterizer():
+            return None
+
+        self.output_dir.mkdir(parents=True, exist_ok=True)
+        with tempfile.TemporaryDirectory() as tmp:
+            tex_file = Path(tmp) / "pgf_batch.tex"
+            with tex_file.open("w", encoding="utf-8") as fp:
+                fp.write(_BATCH_PREAMBLE)
+                for p in paths:
+                    # Use forward slashes for pdflatex compatibility
+                    pgf_posix = str(p).replace("\\", "/")
+                    fp.write(_BATCH_PAGE.format(pgf_path=pgf_posix))
+                fp.write(_BATCH_END)
+
+            # The per-figure limit, scaled to the number of pages in the batch
+            timeout = _pdflatex_timeout() * len(paths)
+            if not _run_pdflatex(tex_file, tmp, f"{len(paths)} PGF files", timeout):
+                return None
+
+            pdf_tmp = Path(tmp) / "pgf_batch.pdf"
+            if not pdf_tmp.exists():
+                return None
+            pages = _render_pdf_pages(pdf_tmp)
+            if len(pages) != len(paths):
+                logger.warning(
+                    f"PGF batch produced {len(pages)} pages for {len(paths)} files"
+                )
+                return None
+
+            outputs: List[str] = []
+            for p, page in zip(paths, pages):
+                png_out = self.output_dir / f"{p.stem}.png"
+                page.save(str(png_out), "PNG", **_PNG_SAVE_OPTS)
+                outputs.append(str(png_out))
+            logger.info(f"PGF batch rendered {len(outputs)} files in one pdflatex run")
+            return outputs
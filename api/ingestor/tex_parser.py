@@ -8,137 +8,229 @@ using regex only (no pylatexenc required).
 import re
 import logging
 from pathlib import Path
-from typing import Optional
+from typing import Dict, Optional, Tuple
+
+from ._common import SectionRec, decode, normalise_newlines
 
 logger = logging.getLogger(__name__)
 
+# ---------------------------------------------------------------------------
+# Precompiled patterns
+# ---------------------------------------------------------------------------
+
+# Bytes patterns: parse_latex scans the raw file contents and only decodes the
+# fragments it keeps.
+_COMMENT_RE = re.compile(rb"(?m)%.*$")
+# With bytes.translate(..., b"{}"): drops stray braces and turns tabs into
+# spaces in a single C-level pass
+_TAB_TABLE = bytes.maketrans(b"\t", b" ")
+# \command{content} with no braces inside content (innermost level only)
+_CMD_ARG_RE = re.compile(rb"\\[a-zA-Z@]+\{([^{}]*)\}")
+_BARE_CMD_RE = re.compile(rb"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])*\s*")
+_MULTI_NEWLINE_RE = re.compile(rb"\n{3,}")
+_HSPACE_RE = re.compile(rb" {2,}")
+_INCLUDE_RE = re.compile(rb"\\(?:input|include)\{([^}]+)\}")
+_AND_RE = re.compile(rb"\\and\b")
+_DBLBACKSLASH_RE = re.compile(rb"\\\\")
+# Match \section, \subsection, \subsubsection (with optional *)
+_SEC_RE = re.compile(
+    rb"\\(section|subsection|subsubsection)\*?\s*\{([^}]*)\}", re.IGNORECASE
+)
+# Environments removed from section bodies (extracted separately)
+_STRIP_ENVS_RE = re.compile(
+    rb"\\begin\{(?:figure|table|tabular|equation|align|align\*|eqnarray|gather|gather\*)\}.*?\\end\{(?:figure|table|tabular|equation|align|align\*|eqnarray|gather|gather\*)\}",
+    re.DOTALL,
+)
+_CAPTION_RE = re.compile(rb"\\caption\{")
+_INC_GRAPHICS_RE = re.compile(rb"\\includegraphics\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}")
+_FIG_ENV_RE = re.compile(
+    rb"\\begin\{figure\}(.*?)\\end\{figure\}", re.DOTALL | re.IGNORECASE
+)
+# Equation sources.  Named math environments are scanned on their own: in a
+# shared alternation an unbalanced or escaped "$" would swallow a following
+# \begin{equation}...\end{equation}.
+_EQ_ENV_RE = re.compile(
+    rb"\\begin\{(equation\*?|align\*?|eqnarray|gather\*?|multline\*?)\}(.*?)\\end\{\1\}",
+    re.DOTALL | re.IGNORECASE,
+)
+# $$...$$ | $...$
+_EQ_DOLLAR_RE = re.compile(
+    rb"\$\$(.+?)\$\$" rb"|(?<!\$)\$(?!\$)([^$\n]{2,}?)(?<!\$)\$(?!\$)",
+    re.DOTALL,
+)
+
+# Per-name patterns built on first use by _extract_env / _extract_command_arg
+_ENV_PATTERNS: Dict[str, "re.Pattern[bytes]"] = {}
+_CMD_PATTERNS: Dict[str, "re.Pattern[bytes]"] = {}
+
+_LEVEL_MAP = {"section": 1, "subsection": 2, "subsubsection": 3}
+
+# Upper bound on nesting depth unwrapped (previously 5 formatting + 5 generic)
+_MAX_UNWRAP_PASSES = 10
+
 
 # ---------------------------------------------------------------------------
 # Helpers
 # ---------------------------------------------------------------------------
 
 
-def _read_file(path: str) -> str:
-    """Read a file trying UTF-8 first, then latin-1."""
-    p = Path(path)
+def _read_file(path: str) -> bytes:
+    """Read a file as raw bytes, with CRLF / CR newlines normalised to LF."""
     try:
-        return p.read_text(encoding="utf-8", errors="replace")
-    except Exception:
-        try:
-            return p.read_text(encoding="latin-1", errors="replace")
-        except Exception as exc:
-            logger.warning(f"Could not read {path}: {exc}")
-            return ""
+        data = Path(path).read_bytes()
+    except Exception as exc:
+        logger.warning(f"Could not read {path}: {exc}")
+        return b""
+    return normalise_newlines(data)
 
 
-def _extract_braced(text: str, start: int) -> str:
+def _extract_braced(text: bytes, start: int) -> bytes:
     """
     Extract the content of the first top-level {...} group starting at or
     after *start*.  Handles nested braces.
-    Returns the content (without outer braces) or '' on failure.
+    Returns the content (without outer braces) or b'' on failure.
     """
-    depth = 0
-    buf: list = []
-    i = start
-    while i < len(text):
-        ch = text[i]
-        if ch == "{":
-            if depth > 0:
-                buf.append(ch)
+    first = text.find(b"{", start)
+    if first == -1:
+        return b""
+    # Jump from brace to brace with find(); each brace is located only once
+    # because the pending next-open / next-close positions are carried over.
+    depth = 1
+    nxt_open = text.find(b"{", first + 1)
+    nxt_close = text.find(b"}", first + 1)
+    while nxt_close != -1:
+        if nxt_open != -1 and nxt_open < nxt_close:
             depth += 1
-        elif ch == "}":
+            nxt_open = text.find(b"{", nxt_open + 1)
+        else:
             depth -= 1
             if depth == 0:
-                return "".join(buf)
-            buf.append(ch)
-        elif depth > 0:
-            buf.append(ch)
-        i += 1
-    return "".join(buf)
+                return text[first + 1 : nxt_close]
+            nxt_close = text.find(b"}", nxt_close + 1)
+    return text[first + 1 :]
 
 
-def _strip_commands(text: str) -> str:
+def _cut_spans(
+    text: bytes, pattern: "re.Pattern[bytes]", start: int, end: int
+) -> bytes:
+    """Return text[start:end] with every *pattern* match removed."""
+    parts: list = []
+    pos = start
+    for m in pattern.finditer(text, start, end):
+        parts.append(text[pos : m.start()])
+        pos = m.end()
+    parts.append(text[pos:end])
+    return b"".join(parts) if len(parts) > 1 else parts[0]
+
+
+def _strip_commands(text: bytes) -> str:
     r"""
-    Remove LaTeX markup from *text*, preserving readable content.
+    Remove LaTeX markup from *text*, returning the readable content as str.
 
     Rules applied (in order):
       1. Remove comments  %...
-      2. Unwrap \textbf{...}, \textit{...}, \emph{...}, etc.
-      3. Remove unknown \command{...} but keep the braced content
-      4. Remove bare \command (no braces)
-      5. Collapse whitespace
+      2. Unwrap \textbf{...}, \emph{...} and any other \command{...},
+         keeping the braced content
+      3. Remove bare \command (no braces)
+      4. Collapse whitespace
     """
     # 1. Strip LaTeX comments
-    text = re.sub(r"(?m)%.*$", "", text)
+    text = _COMMENT_RE.sub(b"", text)
 
-    # 2. Unwrap well-known formatting commands (keep inner text)
-    formatting = r"\\(?:textbf|textit|texttt|emph|underline|textsc|textrm|textsf|textsl|mbox|hbox|vbox|text|mathrm|mathbf|mathit|mathsf|mathtt|mathbb|mathcal|mathfrak)\{([^{}]*)\}"
-    for _ in range(5):  # multiple passes for nesting
-        text = re.sub(formatting, r"\1", text)
+    # 2. Unwrap \command{content} → keep content.  One pattern covers the
+    #    formatting commands (\textbf, \emph, ...) and everything else; each
+    #    pass peels the innermost level, so stop as soon as a pass is a no-op.
+    for _ in range(_MAX_UNWRAP_PASSES):
+        text, n = _CMD_ARG_RE.subn(rb"\1", text)
+        if not n:
+            break
 
-    # 3. Remove \command{content} → keep content  (handles remaining commands)
-    for _ in range(5):
-        text = re.sub(r"\\[a-zA-Z@]+\{([^{}]*)\}", r"\1", text)
+    # 3. Remove bare \command[...] or \command
+    text = _BARE_CMD_RE.sub(b"", text)
 
-    # 4. Remove bare \command[...] or \command
-    text = re.sub(r"\\[a-zA-Z@]+\*?(?:\[[^\]]*\])*\s*", "", text)
+    # 4. Remove stray braces (tabs become spaces for step 5)
+    text = text.translate(_TAB_TABLE, b"{}")
 
-    # 5. Remove stray braces
-    text = text.replace("{", "").replace("}", "")
+    # 5. Collapse whitespace (only runs are rewritten)
+    text = _MULTI_NEWLINE_RE.sub(b"\n\n", text)
+    text = _HSPACE_RE.sub(b" ", text)
+    return decode(text).strip()
 
-    # 6. Collapse whitespace
-    text = re.sub(r"\n{3,}", "\n\n", text)
-    text = re.sub(r"[ \t]+", " ", text)
-    return text.strip()
 
+def _resolve_include(
+    ref: str, base_dir: str, cache: Dict[str, bytes]
+) -> Tuple[Optional[bytes], Optional[str]]:
+    """
+    Locate and read the file named by an \\input / \\include reference.
 
-def _inline_includes(text: str, base_dir: str, depth: int = 0) -> str:
+    Returns (contents, directory) or (None, None) if the file does not exist.
+    Contents are memoised in *cache* by resolved path, so a sub-file that is
+    included several times (macros, shared preambles) is read only once.
+    """
+    if not ref.endswith(".tex"):
+        ref += ".tex"
+    # Try the path as given, then just the filename in the base_dir
+    # (handles paths like ../other/file.tex)
+    for sub_path in (Path(base_dir) / ref, Path(base_dir) / Path(ref).name):
+        if sub_path.exists():
+            key = str(sub_path.resolve())
+            sub_text = cache.get(key)
+            if sub_text is None:
+                sub_text = cache[key] = _read_file(key)
+            return sub_text, str(sub_path.parent)
+    return None, None
+
+
+def _inline_includes(
+    text: bytes,
+    base_dir: str,
+    depth: int = 0,
+    cache: Optional[Dict[str, bytes]] = None,
+) -> bytes:
     """
     Recursively inline \\input{file} and \\include{file} references.
     Prevents infinite recursion with a depth limit of 5.
     """
     if depth > 5:
         return text
-
-    def replacer(m: re.Match) -> str:
-        ref = m.group(1).strip()
-        if not ref.endswith(".tex"):
-            ref += ".tex"
-        sub_path = Path(base_dir) / ref
-        if sub_path.exists():
-            sub_text = _read_file(str(sub_path))
-            return _inline_includes(sub_text, str(sub_path.parent), depth + 1)
-        # Try just the filename in the base_dir (handles paths like ../other/file.tex)
-        sub_path2 = Path(base_dir) / Path(ref).name
-        if sub_path2.exists():
-            sub_text = _read_file(str(sub_path2))
-            return _inline_includes(sub_text, str(sub_path2.parent), depth + 1)
-        logger.debug(f"Could not resolve \\input/\\include: {ref}")
-        return ""
-
-    return re.sub(r"\\(?:input|include)\{([^}]+)\}", replacer, text)
+    if cache is None:
+        cache = {}
+
+    parts: list = []
+    pos = 0
+    for m in _INCLUDE_RE.finditer(text):
+        parts.append(text[pos : m.start()])
+        pos = m.end()
+        ref = decode(m.group(1)).strip()
+        sub_text, sub_dir = _resolve_include(ref, base_dir, cache)
+        if sub_text is None:
+            logger.debug(f"Could not resolve \\input/\\include: {ref}")
+            continue
+        parts.append(_inline_includes(sub_text, sub_dir, depth + 1, cache))
+    if not parts:
+        return text
+    parts.append(text[pos:])
+    return b"".join(parts)
 
 
-def _classify_section(heading: str) -> str:
-    """Map a LaTeX section name to a checkpoint category."""
-    h = heading.lower()
-    if "abstract" in h:
-        return "abstract"
-    if any(
-        k in h
-        for k in (
+# Checked in priority order: the first category with any keyword occurring
+# (as a substring) in the lowercased heading wins.
+_SECTION_KEYWORDS = (
+    ("abstract", ("abstract",)),
+    (
+        "motivation",
+        (
             "introduction",
             "background",
             "related work",
             "related",
             "motivation",
             "prior work",
-        )
-    ):
-        return "motivation"
-    if any(
-        k in h
-        for k in (
+        ),
+    ),
+    (
+        "solution",
+        (
             "method",
             "approach",
             "model",
@@ -147,12 +239,11 @@ def _classify_section(heading: str) -> str:
             "proposed",
             "framework",
             "design",
-        )
-    ):
-        return "solution"
-    if any(
-        k in h
-        for k in (
+        ),
+    ),
+    (
+        "results",
+        (
             "result",
             "experiment",
             "evaluation",
@@ -160,14 +251,35 @@ def _classify_section(heading: str) -> str:
             "benchmark",
             "analysis",
             "ablation",
-        )
-    ):
-        return "results"
-    if any(
-        k in h
-        for k in ("conclusion", "contribution", "summary", "discussion", "future")
-    ):
-        return "contributions"
+        ),
+    ),
+    (
+        "contributions",
+        ("conclusion", "contribution", "summary", "discussion", "future"),
+    ),
+)
+_SECTION_CATEGORIES = tuple(cat for cat, _ in _SECTION_KEYWORDS)
+
+# One lookahead branch per category, all anchored at offset 0: the first
+# branch that finds any of its keywords anywhere in the heading wins, so
+# category priority does not depend on where the keyword occurs.
+# ``lastindex`` is the (1-based) category number.
+_SECTION_CATEGORY_RE = re.compile(
+    "^(?:"
+    + "|".join(
+        "(?=.*?(" + "|".join(re.escape(kw) for kw in kws) + "))"
+        for _, kws in _SECTION_KEYWORDS
+    )
+    + ")",
+    re.DOTALL,
+)
+
+
+def _classify_section(heading: str) -> str:
+    """Map a LaTeX section name to a checkpoint category."""
+    m = _SECTION_CATEGORY_RE.match(heading.lower())
+    if m:
+        return _SECTION_CATEGORIES[m.lastindex - 1]
     return "paper_info"
 
 
@@ -176,22 +288,29 @@ def _classify_section(heading: str) -> str:
 # ---------------------------------------------------------------------------
 
 
-def _extract_env(text: str, env_name: str) -> list:
+def _extract_env(text: bytes, env_name: str) -> list:
     """Extract all contents of \\begin{env_name}...\\end{env_name}."""
-    pattern = re.compile(
-        r"\\begin\{"
-        + re.escape(env_name)
-        + r"\}(.*?)\\end\{"
-        + re.escape(env_name)
-        + r"\}",
-        re.DOTALL | re.IGNORECASE,
-    )
+    pattern = _ENV_PATTERNS.get(env_name)
+    if pattern is None:
+        name = re.escape(env_name.encode())
+        pattern = _ENV_PATTERNS.setdefault(
+            env_name,
+            re.compile(
+                rb"\\begin\{" + name + rb"\}(.*?)\\end\{" + name + rb"\}",
+                re.DOTALL | re.IGNORECASE,
+            ),
+        )
     return [m.group(1) for m in pattern.finditer(text)]
 
 
-def _extract_command_arg(text: str, cmd: str) -> Optional[str]:
+def _extract_command_arg(text: bytes, cmd: str) -> Optional[bytes]:
     """Extract first argument of \\cmd{...}."""
-    m = re.search(r"\\" + re.escape(cmd) + r"\s*\{", text)
+    pattern = _CMD_PATTERNS.get(cmd)
+    if pattern is None:
+        pattern = _CMD_PATTERNS.setdefault(
+            cmd, re.compile(rb"\\" + re.escape(cmd.encode()) + rb"\s*\{")
+        )
+    m = pattern.search(text)
     if not m:
         return None
     return _extract_braced(text, m.end() - 1)
@@ -210,6 +329,7 @@ def parse_latex(path: str) -> dict:
         title, abstract, authors, sections, figures, tables, equations
     """
     base_dir = str(Path(path).parent)
+    # Everything below scans bytes; only the stored fragments are decoded
     raw = _read_file(path)
 
     # Inline \\input / \\include sub-files
@@ -238,8 +358,8 @@ def parse_latex(path: str) -> dict:
     author_raw = _extract_command_arg(raw, "author")
     if author_raw:
         # Flatten multiple authors separated by \and or \\
-        author_text = re.sub(r"\\and\b", ", ", author_raw)
-        author_text = re.sub(r"\\\\", " ", author_text)
+        author_text = _AND_RE.sub(b", ", author_raw)
+        author_text = _DBLBACKSLASH_RE.sub(b" ", author_text)
         result["authors"] = _strip_commands(author_text).strip()
 
     # ------------------------------------------------------------------ #
@@ -252,45 +372,27 @@ def parse_latex(path: str) -> dict:
     # ------------------------------------------------------------------ #
     # 4. Sections                                                         #
     # ------------------------------------------------------------------ #
-    # Match \section, \subsection, \subsubsection (with optional *)
-    _sec_re = re.compile(
-        r"\\(section|subsection|subsubsection)\*?\s*\{([^}]*)\}", re.IGNORECASE
-    )
-    sec_matches = list(_sec_re.finditer(raw))
-
-    _level_map = {"section": 1, "subsection": 2, "subsubsection": 3}
+    sec_matches = list(_SEC_RE.finditer(raw))
 
     for idx, m in enumerate(sec_matches):
-        cmd = m.group(1).lower()
+        cmd = m.group(1).lower().decode()
         heading = _strip_commands(m.group(2)).strip()
-        level = _level_map.get(cmd, 1)
+        level = _LEVEL_MAP.get(cmd, 1)
 
         # Extract section body: text until next section heading
         body_start = m.end()
         body_end = (
             sec_matches[idx + 1].start() if idx + 1 < len(sec_matches) else len(raw)
         )
-        body_raw = raw[body_start:body_end]
-
-        # Strip environments that are extracted separately
-        body_clean = re.sub(
-            r"\\begin\{(?:figure|table|tabular|equation|align|align\*|eqnarray|gather|gather\*)\}.*?\\end\{(?:figure|table|tabular|equation|align|align\*|eqnarray|gather|gather\*)\}",
-            "",
-            body_raw,
-            flags=re.DOTALL,
-        )
+
+        # Strip environments that are extracted separately, cutting the body
+        # straight out of *raw* (one copy instead of slice + sub)
+        body_clean = _cut_spans(raw, _STRIP_ENVS_RE, body_start, body_end)
         text = _strip_commands(body_clean).strip()
 
         category = _classify_section(heading)
 
-        result["sections"].append(
-            {
-                "heading": heading,
-                "level": level,
-                "text": text,
-                "category": category,
-            }
-        )
+        result["sections"].append(SectionRec(heading, level, text, category))
 
         if category == "abstract" and not result["abstract"]:
             result["abstract"] = text
@@ -299,44 +401,45 @@ def parse_latex(path: str) -> dict:
     # 5. Figures                                                          #
     # ------------------------------------------------------------------ #
     # From \begin{figure}...\end{figure} environments
-    for fig_env in _extract_env(raw, "figure"):
+    fig_spans: list = []
+    for fig_m in _FIG_ENV_RE.finditer(raw):
+        fig_spans.append(fig_m.span())
+        fig_env = fig_m.group(1)
         caption = ""
-        cap_m = re.search(r"\\caption\{", fig_env)
+        cap_m = _CAPTION_RE.search(fig_env)
         if cap_m:
             caption = _strip_commands(_extract_braced(fig_env, cap_m.end() - 1))
 
         # Find \includegraphics[...]{file}
-        for ig_m in re.finditer(
-            r"\\includegraphics\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}", fig_env
-        ):
+        for ig_m in _INC_GRAPHICS_RE.finditer(fig_env):
             result["figures"].append(
                 {
                     "caption": caption.strip(),
-                    "path": ig_m.group(1).strip(),
+                    "path": decode(ig_m.group(1)).strip(),
                 }
             )
 
-    # Also pick up bare \includegraphics outside figure environments
-    _fig_env_re = re.compile(
-        r"\\begin\{figure\}.*?\\end\{figure\}", re.DOTALL | re.IGNORECASE
-    )
-    raw_no_figs = _fig_env_re.sub("", raw)
-    for ig_m in re.finditer(
-        r"\\includegraphics\s*(?:\[[^\]]*\])?\s*\{([^}]+)\}", raw_no_figs
-    ):
-        result["figures"].append({"caption": "", "path": ig_m.group(1).strip()})
+    # Also pick up bare \includegraphics outside figure environments, i.e.
+    # in the gaps between the spans recorded above (no copy of *raw* made)
+    gap_start = 0
+    for span_start, span_end in fig_spans + [(len(raw), len(raw))]:
+        for ig_m in _INC_GRAPHICS_RE.finditer(raw, gap_start, span_start):
+            result["figures"].append(
+                {"caption": "", "path": decode(ig_m.group(1)).strip()}
+            )
+        gap_start = span_end
 
     # ------------------------------------------------------------------ #
     # 6. Tables                                                           #
     # ------------------------------------------------------------------ #
     for tab_env in _extract_env(raw, "tabular"):
-        result["tables"].append(tab_env.strip())
+        result["tables"].append(decode(tab_env).strip())
 
     # Also grab whole table environments (for caption context)
     for tbl_env in _extract_env(raw, "table"):
         # Only if it doesn't contain a tabular (already captured above)
-        if r"\begin{tabular}" not in tbl_env:
-            cap_m = re.search(r"\\caption\{", tbl_env)
+        if rb"\begin{tabular}" not in tbl_env:
+            cap_m = _CAPTION_RE.search(tbl_env)
             if cap_m:
                 cap = _strip_commands(_extract_braced(tbl_env, cap_m.end() - 1))
                 result["tables"].append(f"[Table: {cap.strip()}]")
@@ -344,43 +447,15 @@ def parse_latex(path: str) -> dict:
     # ------------------------------------------------------------------ #
     # 7. Equations                                                        #
     # ------------------------------------------------------------------ #
-    # Named environments
-    for env in (
-        "equation",
-        "equation*",
-        "align",
-        "align*",
-        "eqnarray",
-        "gather",
-        "gather*",
-        "multline",
-        "multline*",
-    ):
-        for content in _extract_env(raw, env):
-            eq = content.strip()
-            if eq:
-                result["equations"].append(eq)
-
-    # Inline $...$
-    for m in re.finditer(r"(?<!\$)\$(?!\$)([^$\n]{2,}?)(?<!\$)\$(?!\$)", raw):
-        eq = m.group(1).strip()
-        if eq:
-            result["equations"].append(eq)
-
-    # $$...$$ display math
-    for m in re.finditer(r"\$\$(.+?)\$\$", raw, re.DOTALL):
-        eq = m.group(1).strip()
-        if eq:
-            result["equations"].append(eq)
-
-    # Deduplicate equations (preserve order)
+    # One scan for math environments, one for $$...$$ and $...$, deduplicated
+    # in order.  lastindex is the body group of whichever branch hit.
     seen: set = set()
-    unique_eqs = []
-    for eq in result["equations"]:
-        if eq not in seen:
-            seen.add(eq)
-            unique_eqs.append(eq)
-    result["equations"] = unique_eqs
+    for pattern in (_EQ_ENV_RE, _EQ_DOLLAR_RE):
+        for m in pattern.finditer(raw):
+            eq = decode(m.group(m.lastindex)).strip()
+            if eq and eq not in seen:
+                seen.add(eq)
+                result["equations"].append(eq)
 
     logger.debug(
         "parse_latex: title=%r sections=%d figures=%d tables=%d equations=%d",
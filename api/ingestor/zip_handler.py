@@ -3,16 +3,105 @@ ZIP handler for direct document ingestion.
 
 Extracts a ZIP archive and identifies the main .tex file using a
 scoring heuristic (same logic previously in preprocessor.detect_main_tex).
+extract_main_only() ranks candidates from the archive itself and writes only
+the main file plus the sources it includes.
 """
 
 import re
+import posixpath
 import zipfile
 import logging
+from concurrent.futures import ThreadPoolExecutor
+from operator import itemgetter
 from pathlib import Path
-from typing import Optional
+from typing import Dict, List, Union
 
 logger = logging.getLogger(__name__)
 
+_INCLUDE_RE = re.compile(r"\\(?:input|include)\{([^}]+)\}")
+
+# .tex members larger than this are not read when ranking main-file candidates
+_MAX_TEX_SCAN_BYTES = 1 << 20
+
+# Upper bound on threads used to decompress .tex members
+_MAX_READ_WORKERS = 8
+
+
+def _read_tex_members(
+    zf: zipfile.ZipFile, members: List[Union[str, zipfile.ZipInfo]]
+) -> Dict[str, str]:
+    """
+    Read and decode *members* of *zf*, keyed by member name.
+
+    zlib releases the GIL while inflating and ZipFile serialises access to
+    the underlying file, so members are decompressed on a small thread pool.
+    """
+    names = [m.filename if isinstance(m, zipfile.ZipInfo) else m for m in members]
+
+    def read(member: Union[str, zipfile.ZipInfo]) -> str:
+        return zf.read(member).decode("utf-8", errors="ignore")
+
+    if len(members) < 2:
+        return {name: read(m) for name, m in zip(names, members)}
+    workers = min(len(members), _MAX_READ_WORKERS)
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zip-read") as ex:
+        return dict(zip(names, ex.map(read, members)))
+
+
+def _is_safe_member(name: str) -> bool:
+    """
+    True if member *name* stays inside the extraction directory as written.
+
+    Absolute names, drive-letter names and names with a ".." component are
+    rewritten by ZipFile.extract(), so their raw name must never be used to
+    build a path (nor followed when resolving includes).
+    """
+    parts = name.replace("\\", "/").split("/")
+    if not parts[0] or parts[0][1:2] == ":":  # absolute or drive-qualified
+        return False
+    return ".." not in parts
+
+
+def _basename(path: str) -> str:
+    """Final component of *path*, for either separator style."""
+    return path.replace("\\", "/").rsplit("/", 1)[-1]
+
+
+def _score_tex_contents(contents: Dict[str, str]) -> Dict[str, int]:
+    """
+    Score candidate main files; *contents* maps each .tex path to its text.
+
+    See extract_and_find_main() for the heuristic.
+    """
+    # Index candidates by basename so each include is a dict lookup
+    by_name: Dict[str, List[str]] = {}
+    for tex_path in contents:
+        by_name.setdefault(_basename(tex_path), []).append(tex_path)
+
+    # Count how many times each file is included by another
+    inclusion_count: dict = {tex_path: 0 for tex_path in contents}
+    for reader_path, content in contents.items():
+        for match in _INCLUDE_RE.finditer(content):
+            included = match.group(1).strip()
+            if not included.endswith(".tex"):
+                included += ".tex"
+            for tex_path in by_name.get(_basename(included), ()):
+                if tex_path != reader_path:
+                    inclusion_count[tex_path] += 1
+
+    # Score and rank
+    scores: dict = {}
+    for tex_path, content in contents.items():
+        score = 0
+        if r"\documentclass" in content:
+            score += 100
+        if r"\begin{document}" in content:
+            score += 50
+        score -= 10 * inclusion_count.get(tex_path, 0)
+        scores[tex_path] = score
+
+    return scores
+
 
 def extract_and_find_main(zip_path: str, extract_dir: str) -> str:
     """
@@ -41,51 +130,129 @@ def extract_and_find_main(zip_path: str, extract_dir: str) -> str:
     logger.info(f"Extracting ZIP: {Path(zip_path).name} → {extract_path}")
     try:
         with zipfile.ZipFile(zip_path, "r") as zf:
-            zf.extractall(str(extract_path))
+            # Score the .tex members straight from the archive, then extract;
+            # nothing is read back from disk.
+            tex_members = [
+                name
+                for name in zf.namelist()
+                if name.lower().endswith(".tex") and not name.endswith("/")
+            ]
+            if not tex_members:
+                raise ValueError(
+                    f"No .tex files found in ZIP archive: {Path(zip_path).name}"
+                )
+            contents = _read_tex_members(zf, tex_members)
+            scores = _score_tex_contents(contents)
+            best, best_score = max(scores.items(), key=itemgetter(1))
+            logger.info(f"Main .tex detected: {Path(best).name} (score={best_score})")
+
+            # Same as extractall(), but keep the sanitised path extract() wrote
+            # for the main file; the raw member name may be absolute or contain
+            # "..", so it must not be joined onto extract_path.
+            for info in zf.infolist():
+                written = zf.extract(info, str(extract_path))
+                if info.filename == best:
+                    main_path = written
     except zipfile.BadZipFile as exc:
         raise RuntimeError(f"Bad ZIP file: {zip_path}") from exc
 
-    tex_files = list(extract_path.rglob("*.tex"))
-    if not tex_files:
-        raise ValueError(f"No .tex files found in ZIP archive: {Path(zip_path).name}")
+    return main_path
 
-    # Read all file contents up-front
-    contents: dict = {}
-    for tf in tex_files:
-        try:
-            contents[str(tf)] = tf.read_text(encoding="utf-8", errors="ignore")
-        except Exception as exc:
-            logger.warning(f"Could not read {tf}: {exc}")
-            contents[str(tf)] = ""
 
-    # Count how many times each file is included by another
-    inclusion_count: dict = {str(tf): 0 for tf in tex_files}
-    include_re = re.compile(r"\\(?:input|include)\{([^}]+)\}")
+def _include_closure(
+    zf: zipfile.ZipFile, main: str, contents: Dict[str, str]
+) -> List[str]:
+    """
+    Return *main* plus every member reachable through \\input / \\include.
 
-    for reader_path, content in contents.items():
-        for match in include_re.finditer(content):
-            included = match.group(1).strip()
-            if not included.endswith(".tex"):
-                included += ".tex"
-            included_name = Path(included).name
-            for tf in tex_files:
-                if str(tf) != reader_path and (
-                    tf.name == included_name
-                    or str(tf).replace("\\", "/").endswith(included.replace("\\", "/"))
-                ):
-                    inclusion_count[str(tf)] = inclusion_count.get(str(tf), 0) + 1
+    References are resolved the way tex_parser._inline_includes() does:
+    relative to the including file's directory, then by bare filename in
+    that directory.  Members missing from *contents* are read on demand;
+    references that would resolve outside the archive root are ignored.
+    """
+    members = set(zf.namelist())
+    closure = [main]
+    queue = [main]
+    while queue:
+        name = queue.pop()
+        if name not in contents:
+            contents[name] = zf.read(name).decode("utf-8", errors="ignore")
+        base = posixpath.dirname(name)
+        for match in _INCLUDE_RE.finditer(contents[name]):
+            ref = match.group(1).strip().replace("\\", "/")
+            if not ref.endswith(".tex"):
+                ref += ".tex"
+            for cand in (
+                posixpath.normpath(posixpath.join(base, ref)),
+                posixpath.normpath(posixpath.join(base, posixpath.basename(ref))),
+            ):
+                if cand in members and _is_safe_member(cand):
+                    if cand not in closure:
+                        closure.append(cand)
+                        queue.append(cand)
+                    break
+    return closure
 
-    # Score and rank
-    scores: dict = {}
-    for tex_path, content in contents.items():
-        score = 0
-        if r"\documentclass" in content:
-            score += 100
-        if r"\begin{document}" in content:
-            score += 50
-        score -= 10 * inclusion_count.get(tex_path, 0)
-        scores[tex_path] = score
 
-    best = max(scores, key=lambda k: scores[k])
-    logger.info(f"Main .tex detected: {Path(best).name} (score={scores[best]})")
-    return best
+def extract_main_only(zip_path: str, extract_dir: str) -> str:
+    """
+    Extract only the main .tex file and its \\input / \\include closure.
+
+    Candidates are ranked from the archive's central directory alone: every
+    .tex member under 1 MB (absolute or ".." member names are skipped) is
+    read into memory (shallowest paths first, which
+    also wins score ties) and scored with the extract_and_find_main()
+    heuristic.  Figures, PDFs and other assets are never written – the LaTeX
+    parser only records their paths – so large source bundles cost a few
+    small reads instead of a full extraction.
+
+    Returns:
+        Absolute path of the extracted main .tex file.
+
+    Raises:
+        ValueError: No .tex files found in the archive.
+        RuntimeError: ZIP extraction failed.
+    """
+    extract_path = Path(extract_dir)
+    extract_path.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with zipfile.ZipFile(zip_path, "r") as zf:
+            candidates = sorted(
+                (
+                    info
+                    for info in zf.infolist()
+                    if not info.is_dir()
+                    and info.filename.lower().endswith(".tex")
+                    and _is_safe_member(info.filename)
+                ),
+                key=lambda info: info.filename.count("/"),
+            )
+            if not candidates:
+                raise ValueError(
+                    f"No .tex files found in ZIP archive: {Path(zip_path).name}"
+                )
+            contents = _read_tex_members(
+                zf,
+                [info for info in candidates if info.file_size < _MAX_TEX_SCAN_BYTES],
+            )
+            if not contents:
+                # Only oversized sources; fall back to the shallowest one
+                contents[candidates[0].filename] = ""
+
+            scores = _score_tex_contents(contents)
+            best, best_score = max(scores.items(), key=itemgetter(1))
+            logger.info(f"Main .tex detected: {Path(best).name} (score={best_score})")
+
+            closure = _include_closure(zf, best, contents)
+            # Report the path extract() actually wrote, never one rebuilt
+            # from the raw member name
+            written = {name: zf.extract(name, str(extract_path)) for name in closure}
+    except zipfile.BadZipFile as exc:
+        raise RuntimeError(f"Bad ZIP file: {zip_path}") from exc
+
+    logger.info(
+        f"Extracted {len(closure)} source file(s) from {Path(zip_path).name}"
+        f" → {extract_path}"
+    )
+    return written[best]
@@ -9,6 +9,7 @@ Flow:
   5. Frontend polls /auth/oauth/status until authenticated=true
 """
 
+import asyncio
 import hashlib
 import base64
 import secrets
@@ -37,14 +38,30 @@ CODEX_RESPONSES = "/codex/responses"
 def _generate_pkce() -> Tuple[str, str]:
     """Return (code_verifier, code_challenge)."""
     verifier = secrets.token_urlsafe(64)
-    challenge = (
-        base64.urlsafe_b64encode(hashlib.sha256(verifier.encode()).digest())
-        .rstrip(b"=")
-        .decode()
-    )
+    digest = hashlib.sha256(verifier.encode("ascii")).digest()
+    # A 32-byte digest always encodes to 44 chars ending in exactly one "="
+    challenge = base64.urlsafe_b64encode(digest)[:-1].decode("ascii")
     return verifier, challenge
 
 
+# ── JWT decode ──────────────────────────────────────────────────────────────
+
+
+def _decode_jwt(token: str) -> Optional[Tuple[Optional[str], Optional[str]]]:
+    """Return (account_id, email) from a JWT payload, or None if undecodable."""
+    parts = token.split(".")
+    if len(parts) < 2:
+        return None
+    try:
+        pad = 4 - len(parts[1]) % 4
+        payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * pad))
+        auth = payload.get("https://api.openai.com/auth", {})
+        return auth.get("chatgpt_account_id"), payload.get("email")
+    except Exception as e:
+        logger.warning("JWT decode error: %s", e)
+        return None
+
+
 # ── OAuthManager ────────────────────────────────────────────────────────────
 
 
@@ -59,6 +76,8 @@ class OAuthManager:
         self._expires_at: float = 0.0
         self._account_id: Optional[str] = None
         self._email: Optional[str] = None
+        # Shared so refreshes re-use the pooled TLS connection to TOKEN_URL
+        self._client: Optional[httpx.AsyncClient] = None
 
     # ── flow start ──────────────────────────────────────────────────────────
 
@@ -107,30 +126,44 @@ class OAuthManager:
     def validate_state(self, state: str) -> bool:
         return bool(self._state and self._state == state)
 
+    # ── HTTP client ─────────────────────────────────────────────────────────
+
+    async def _get_client(self) -> httpx.AsyncClient:
+        """Return the shared token-endpoint client, creating it on first use."""
+        if self._client is None or self._client.is_closed:
+            self._client = httpx.AsyncClient(timeout=30)
+        return self._client
+
+    async def aclose(self):
+        """Close the shared HTTP client (call on application shutdown)."""
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
     # ── code exchange ───────────────────────────────────────────────────────
 
     async def exchange_code(self, code: str, port: int) -> bool:
         """POST to TOKEN_URL to get access + refresh tokens."""
         redirect_uri = f"http://localhost:{port}/auth/oauth/callback"
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(
-                    TOKEN_URL,
-                    json={
-                        "grant_type": "authorization_code",
-                        "client_id": CLIENT_ID,
-                        "code": code,
-                        "code_verifier": self._verifier,
-                        "redirect_uri": redirect_uri,
-                    },
-                )
+            client = await self._get_client()
+            resp = await client.post(
+                TOKEN_URL,
+                json={
+                    "grant_type": "authorization_code",
+                    "client_id": CLIENT_ID,
+                    "code": code,
+                    "code_verifier": self._verifier,
+                    "redirect_uri": redirect_uri,
+                },
+            )
             if resp.status_code != 200:
                 logger.error(
                     "Token exchange failed: %s %s", resp.status_code, resp.text
                 )
                 return False
             data = resp.json()
-            self._store_tokens(data)
+            await self._store_tokens(data)
             return True
         except Exception as e:
             logger.error("Token exchange error: %s", e)
@@ -142,46 +175,37 @@ class OAuthManager:
         if not self._refresh_token:
             return False
         try:
-            async with httpx.AsyncClient(timeout=30) as client:
-                resp = await client.post(
-                    TOKEN_URL,
-                    json={
-                        "grant_type": "refresh_token",
-                        "client_id": CLIENT_ID,
-                        "refresh_token": self._refresh_token,
-                    },
-                )
+            client = await self._get_client()
+            resp = await client.post(
+                TOKEN_URL,
+                json={
+                    "grant_type": "refresh_token",
+                    "client_id": CLIENT_ID,
+                    "refresh_token": self._refresh_token,
+                },
+            )
             if resp.status_code != 200:
                 logger.warning("Token refresh failed: %s", resp.status_code)
                 return False
-            self._store_tokens(resp.json())
+            await self._store_tokens(resp.json())
             return True
         except Exception as e:
             logger.error("Token refresh error: %s", e)
             return False
 
-    def _store_tokens(self, data: dict):
-        self._access_token = data["access_token"]
+    async def _store_tokens(self, data: dict):
+        access_token = data["access_token"]
+        # Decode off the event loop so concurrent requests are not stalled
+        claims = await asyncio.to_thread(_decode_jwt, access_token)
+        # Assign everything only after the await, so no request ever sees the
+        # new token paired with a stale account id / email
+        self._access_token = access_token
         self._refresh_token = data.get("refresh_token", self._refresh_token)
         self._expires_at = time.time() + data.get("expires_in", 3600) - 60
-        self._decode_jwt(self._access_token)
+        if claims is not None:
+            self._account_id, self._email = claims
         logger.info("OAuth tokens stored for %s", self._email)
 
-    # ── JWT decode ──────────────────────────────────────────────────────────
-
-    def _decode_jwt(self, token: str):
-        parts = token.split(".")
-        if len(parts) < 2:
-            return
-        try:
-            pad = 4 - len(parts[1]) % 4
-            payload = json.loads(base64.urlsafe_b64decode(parts[1] + "=" * pad))
-            auth = payload.get("https://api.openai.com/auth", {})
-            self._account_id = auth.get("chatgpt_account_id")
-            self._email = payload.get("email")
-        except Exception as e:
-            logger.warning("JWT decode error: %s", e)
-
     # ── public helpers ──────────────────────────────────────────────────────
 
     def is_authenticated(self) -> bool:
@@ -190,6 +190,11 @@ h2{color:#16a34a;margin-bottom:.5rem}p{color:#555}
 </div></body></html>"""
 
 
+@app.on_event("shutdown")
+async def oauth_shutdown():
+    await oauth_manager.aclose()
+
+
 @app.get("/auth/oauth/start")
 async def oauth_start():
     auth_url = oauth_manager.start_flow(SERVER_PORT)
@@ -5,9 +5,11 @@ Each image occupies a full-bleed slide with no additional chrome.
 
 from __future__ import annotations
 
+import io
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import List
+from typing import Dict, List, Optional, Tuple
 
 logger = logging.getLogger(__name__)
 
@@ -47,17 +49,50 @@ def create_pptx_from_images(
     if not image_paths:
         raise ValueError("image_paths must not be empty")
 
+    # ------------------------------------------------------------------
+    # Load every distinct image once, reading files and headers in parallel
+    # ------------------------------------------------------------------
+    # Repeated images (logos, section dividers) re-use the in-memory blob and
+    # python-pptx embeds the part once.  Image.open only parses the header,
+    # so no pixel data is decoded for the size.
+    keys = [Path(p).resolve() for p in image_paths]
+    unique = list(dict.fromkeys(keys))
+
+    def _load(path: Path) -> Tuple[io.BytesIO, Optional[Tuple[int, int]]]:
+        blob = io.BytesIO(path.read_bytes())
+        if not _pil_available:
+            return blob, None
+        with _PILImage.open(blob) as im:
+            return blob, im.size
+
+    with ThreadPoolExecutor(max_workers=min(len(unique), 8)) as pool:
+        loaded: Dict[Path, Tuple[io.BytesIO, Optional[Tuple[int, int]]]] = dict(
+            zip(unique, pool.map(_load, unique))
+        )
+
     # ------------------------------------------------------------------
     # Determine slide dimensions from the first image
     # ------------------------------------------------------------------
-    first = image_paths[0]
-    if _pil_available:
-        with _PILImage.open(first) as im:
-            img_w_px, img_h_px = im.size
+    first_size = loaded[keys[0]][1]
+    if first_size is not None:
+        img_w_px, img_h_px = first_size
     else:
         # Fallback: assume square (common for Paper2Slides outputs)
         img_w_px, img_h_px = 1024, 1024
 
+    # Images whose aspect ratio differs (by >1%) from the first get stretched
+    aspect = img_h_px / img_w_px
+    for key, (_, size) in loaded.items():
+        if size and abs(size[1] / size[0] - aspect) > 0.01 * aspect:
+            logger.warning(
+                "%s is %dx%d but slides are sized for %dx%d; it will be stretched",
+                key.name,
+                size[0],
+                size[1],
+                img_w_px,
+                img_h_px,
+            )
+
     # Scale so width = 10 inches (914400 EMU/inch)
     EMU_PER_INCH = 914_400
     slide_w_emu = 10 * EMU_PER_INCH
@@ -69,10 +104,12 @@ def create_pptx_from_images(
 
     blank_layout = prs.slide_layouts[6]  # index 6 = completely blank
 
-    for img_path in image_paths:
+    for key in keys:
+        blob = loaded[key][0]
+        blob.seek(0)
         slide = prs.slides.add_slide(blank_layout)
         slide.shapes.add_picture(
-            str(img_path),
+            blob,
             left=0,
             top=0,
             width=prs.slide_width,
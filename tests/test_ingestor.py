@@ -0,0 +1,27 @@
+"""
+Regression tests for api/ingestor/ingestor.py.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from ingestor.ingestor import ingest_documents  # noqa: E402
+
+
+def test_ingest_documents_gives_each_file_its_own_dir(tmp_path):
+    # "a_2" is taken by the first file, so the third one's suffixed name
+    # must move on instead of reusing it.
+    paths = []
+    for rel in ("a_2.md", "a.md", "x/a.md"):
+        md = tmp_path / rel
+        md.parent.mkdir(exist_ok=True)
+        md.write_text(f"# {rel}\n\n## Intro\nText.\n", encoding="utf-8")
+        paths.append(str(md))
+    out = tmp_path / "out"
+
+    results = ingest_documents(paths, {}, str(out), max_workers=1)
+
+    dirs = [Path(r["markdown_paths"][0]).relative_to(out).parts[0] for r in results]
+    assert len(set(dirs)) == len(paths)
@@ -0,0 +1,65 @@
+"""
+Regression tests for api/ingestor/md_parser.py.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from ingestor.md_parser import parse_markdown  # noqa: E402
+
+
+def test_dollar_pairs_do_not_hide_headings(tmp_path):
+    # A shell "$$" and a later "$$" form a block-equation match spanning the
+    # headings in between; every heading must still become its own section.
+    md = tmp_path / "doc.md"
+    md.write_text(
+        "## Setup\n"
+        "Run `echo $$` to print the PID.\n"
+        "\n"
+        "## Results\n"
+        "Throughput doubled.\n"
+        "\n"
+        "## Conclusion\n"
+        "The price is $$ well spent.\n"
+        "\n"
+        "## Future\n"
+        "More work.\n",
+        encoding="utf-8",
+    )
+
+    result = parse_markdown(str(md))
+
+    assert [s.heading for s in result["sections"]] == [
+        "Setup",
+        "Results",
+        "Conclusion",
+        "Future",
+    ]
+    assert [s.category for s in result["sections"]] == [
+        "paper_info",
+        "results",
+        "contributions",
+        "contributions",
+    ]
+    assert result["sections"][1].text == "Throughput doubled."
+
+
+def test_dollar_pairs_do_not_hide_figures(tmp_path):
+    md = tmp_path / "doc.md"
+    md.write_text(
+        "# Setup\n"
+        "Run `echo $$`\n"
+        "\n"
+        "![Overview](arch.png)\n"
+        "\n"
+        "![Pipeline](pipe.png)\n"
+        "\n"
+        "The budget was $$ huge",
+        encoding="utf-8",
+    )
+
+    result = parse_markdown(str(md))
+
+    assert [f["path"] for f in result["figures"]] == ["arch.png", "pipe.png"]
@@ -0,0 +1,26 @@
+"""
+Regression tests for api/ingestor/tex_parser.py.
+"""
+
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from ingestor.tex_parser import parse_latex  # noqa: E402
+
+
+def test_escaped_dollars_do_not_hide_math_environments(tmp_path):
+    # "\$$2{,}000$" pairs up with the next "$$" across the equation
+    # environment; the environment must still be extracted.
+    tex = tmp_path / "main.tex"
+    tex.write_text(
+        "Training cost \\$$2{,}000$ per run.\n"
+        "\\begin{equation}L = \\sum_i \\ell_i\\end{equation}\n"
+        "Inference cost \\$$5$.\n",
+        encoding="utf-8",
+    )
+
+    result = parse_latex(str(tex))
+
+    assert "L = \\sum_i \\ell_i" in result["equations"]
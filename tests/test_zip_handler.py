@@ -0,0 +1,73 @@
+"""
+Regression tests for api/ingestor/zip_handler.py.
+"""
+
+import sys
+import zipfile
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "api"))
+
+from ingestor.zip_handler import extract_and_find_main, extract_main_only  # noqa: E402
+
+_MAIN_TEX = r"\documentclass{article}\begin{document}x\end{document}"
+
+
+def _make_zip(path: Path, members: dict) -> str:
+    with zipfile.ZipFile(path, "w") as zf:
+        for name, data in members.items():
+            zf.writestr(name, data)
+    return str(path)
+
+
+def test_extract_main_only_ignores_absolute_members(tmp_path):
+    outside = tmp_path / "victim" / "secret.tex"
+    outside.parent.mkdir()
+    outside.write_text(_MAIN_TEX, encoding="utf-8")
+    zip_path = _make_zip(
+        tmp_path / "evil.zip",
+        # The outside file scores higher than the legitimate candidate
+        {outside.as_posix(): _MAIN_TEX, "paper/main.tex": r"\documentclass{article}"},
+    )
+    extract_dir = tmp_path / "out"
+
+    main = Path(extract_main_only(zip_path, str(extract_dir)))
+
+    assert main == extract_dir / "paper" / "main.tex"
+    assert main.is_file()
+
+
+def test_extract_main_only_skips_parent_dir_includes(tmp_path):
+    zip_path = _make_zip(
+        tmp_path / "evil.zip",
+        {
+            "paper/main.tex": _MAIN_TEX + r"\input{../../up}\input{sub}",
+            "../up.tex": "outside",
+            "paper/sub.tex": "inside",
+        },
+    )
+    extract_dir = tmp_path / "out"
+
+    extract_main_only(zip_path, str(extract_dir))
+
+    written = sorted(p.relative_to(tmp_path).as_posix() for p in tmp_path.rglob("*"))
+    assert written == [
+        "evil.zip",
+        "out",
+        "out/paper",
+        "out/paper/main.tex",
+        "out/paper/sub.tex",
+    ]
+
+
+def test_extract_and_find_main_returns_written_path(tmp_path):
+    outside = tmp_path / "victim" / "secret.tex"
+    outside.parent.mkdir()
+    outside.write_text(_MAIN_TEX, encoding="utf-8")
+    zip_path = _make_zip(tmp_path / "evil.zip", {outside.as_posix(): _MAIN_TEX})
+    extract_dir = tmp_path / "out"
+
+    main = Path(extract_and_find_main(zip_path, str(extract_dir)))
+
+    assert main.is_relative_to(extract_dir)
+    assert main.read_text(encoding="utf-8") == _MAIN_TEX